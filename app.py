@@ -6,8 +6,17 @@ from textual.widgets import Header, Footer, Static
 from textual.binding import Binding
 from textual.timer import Timer
 
-from models.game import GameState
-from models.generator import Difficulty
+from models.game import (
+    DIRTY_ALL,
+    DIRTY_BOARD,
+    DIRTY_CONTROLS,
+    DIRTY_GRID,
+    DIRTY_NONE,
+    DIRTY_NUMPAD,
+    DIRTY_STATS,
+    GameState,
+)
+from models.difficulty import Difficulty
 from widgets.grid import SudokuGrid
 from widgets.numpad import Numpad
 from widgets.controls import Controls
@@ -130,6 +139,12 @@ class SudokuApp(App):
         self.controls: Controls | None = None
         self.stats: Stats | None = None
         self.completion_banner: Static | None = None
+        self._display_dirty = False
+        self._pending_flags = DIRTY_NONE
+        self._last_time_str: str | None = None
+        # Cells edited since the last paint; None means a full grid refresh
+        self._pending_cells: set[tuple[int, int]] | None = None
+        self._last_selected: tuple[int, int] | None = None
 
     def compose(self) -> ComposeResult:
         """Create the app layout."""
@@ -164,7 +179,7 @@ class SudokuApp(App):
         """Initialize the game on mount."""
         # Start a new game
         self.game.new_game(Difficulty.MEDIUM)
-        self._update_display()
+        self._mark_display_dirty()
 
         # Start the timer
         self.timer = self.set_interval(1.0, self._tick_timer)
@@ -176,34 +191,89 @@ class SudokuApp(App):
         """Update the timer every second."""
         if not self.game.is_paused and not self.game.is_complete:
             self.game.timer += 1.0
+            self._update_timer_display()
+
+    def _update_timer_display(self) -> None:
+        """Push the timer label, skipping when the text hasn't changed."""
+        time_str = self.game.format_time()
+        if time_str != self._last_time_str:
+            self._last_time_str = time_str
             if self.stats:
-                self.stats.update_timer(self.game.format_time())
+                self.stats.update_timer(time_str)
 
-    def _update_display(self) -> None:
-        """Update all display elements."""
+    def _sync_timer(self) -> None:
+        """Pause the tick timer while the game is paused or solved."""
+        if self.timer is None:
+            return
+        if self.game.is_paused or self.game.is_complete:
+            self.timer.pause()
+        else:
+            self.timer.resume()
+
+    def _mark_display_dirty(self, cell: tuple[int, int] | None = None,
+                            flags: int = DIRTY_ALL) -> None:
+        """
+        Schedule a display update, coalescing bursts into one refresh.
+        `flags` says which display areas changed (DIRTY_NONE is a no-op);
+        pass the edited cell to allow a targeted repaint instead of a full
+        grid rebuild.
+        """
+        if flags == DIRTY_NONE:
+            return
+        if not self._display_dirty:
+            self._display_dirty = True
+            self._pending_flags = flags
+            self._pending_cells = {cell} if cell is not None else None
+            self.call_after_refresh(self._flush_display)
+            return
+        self._pending_flags |= flags
+        if flags & DIRTY_GRID:
+            if cell is None:
+                self._pending_cells = None
+            elif self._pending_cells is not None:
+                self._pending_cells.add(cell)
+
+    def _flush_display(self) -> None:
+        """Run the pending display update, if any."""
+        if self._display_dirty:
+            self._display_dirty = False
+            flags = self._pending_flags
+            self._pending_flags = DIRTY_NONE
+            self._update_display(flags)
+            self._sync_timer()
+
+    def _update_display(self, flags: int = DIRTY_ALL) -> None:
+        """Update the display areas marked in the given DIRTY_* bitmask."""
         if not self.grid or not self.stats or not self.numpad:
             return
 
         # Get highlighted digit (from selected cell)
         highlight_digit = self.game.get_selected_digit()
 
-        # Update grid
-        self.grid.update_from_board(
-            self.game.board,
-            self.game.selected_cell,
-            highlight_digit
-        )
-
-        # Update stats
-        counts = self.game.board.get_digit_counts()
-        self.stats.update_counts(counts, highlight_digit)
-        self.stats.update_timer(self.game.format_time())
-
-        # Update numpad
-        self.numpad.update_digit_states(counts, highlight_digit)
+        # Update grid: repaint only the affected cells when we know which
+        # cells were edited and the selection hasn't moved
+        if flags & DIRTY_GRID:
+            selected = self.game.selected_rowcol
+            if self._pending_cells is not None and selected == self._last_selected:
+                self.grid.update_cells(
+                    self.game.board, self._pending_cells, selected, highlight_digit
+                )
+            else:
+                self.grid.update_from_board(self.game.board, selected, highlight_digit)
+            self._last_selected = selected
+            self._pending_cells = None
+
+        # Update stats and numpad, sharing one digit count pass
+        if flags & (DIRTY_STATS | DIRTY_NUMPAD):
+            counts = self.game.board.get_digit_counts()
+            if flags & DIRTY_STATS:
+                self.stats.update_counts(counts, highlight_digit)
+                self._update_timer_display()
+            if flags & DIRTY_NUMPAD:
+                self.numpad.update_digit_states(counts, highlight_digit)
 
         # Update notes button
-        if self.controls:
+        if flags & DIRTY_CONTROLS and self.controls:
             self.controls.update_notes_state(self.game.notes_mode)
 
         # Show/hide completion banner
@@ -244,28 +314,27 @@ class SudokuApp(App):
     # Message handlers
     def on_sudoku_grid_cell_selected(self, event: SudokuGrid.CellSelected) -> None:
         """Handle cell selection from grid."""
-        self.game.select_cell(event.row, event.col)
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.select_cell(event.row, event.col))
 
     def on_numpad_digit_pressed(self, event: Numpad.DigitPressed) -> None:
         """Handle numpad digit press."""
-        if self.game.selected_cell:
-            row, col = self.game.selected_cell
-            self.game.make_move(row, col, event.digit)
-            self._update_display()
+        if self.game.selected_cell >= 0:
+            row, col = divmod(self.game.selected_cell, 9)
+            flags = self.game.make_move(row, col, event.digit)
+            self._mark_display_dirty((row, col), flags)
             self._check_completion()
 
     def on_numpad_clear_pressed(self, event: Numpad.ClearPressed) -> None:
         """Handle numpad clear press."""
-        if self.game.selected_cell:
-            row, col = self.game.selected_cell
-            self.game.clear_cell(row, col)
-            self._update_display()
+        if self.game.selected_cell >= 0:
+            row, col = divmod(self.game.selected_cell, 9)
+            flags = self.game.clear_cell(row, col)
+            self._mark_display_dirty((row, col), flags)
 
     def on_controls_new_game(self, event: Controls.NewGame) -> None:
         """Handle new game request."""
         self.game.new_game(event.difficulty)
-        self._update_display()
+        self._mark_display_dirty()
         self._update_best_time()
         if self.completion_banner:
             self.completion_banner.remove_class("visible")
@@ -289,65 +358,57 @@ class SudokuApp(App):
         """Handle notes toggle."""
         self.action_toggle_notes()
 
-    def on_stats_digit_clicked(self, event: Stats.DigitClicked) -> None:
+    def on_digit_counts_clicked(self, event: Stats.DigitClicked) -> None:
         """Handle digit count click - highlight all of that digit."""
         # Find first cell with this digit and select it
         positions = self.game.board.get_same_digit_positions(event.digit)
         if positions:
             row, col = positions[0]
-            self.game.select_cell(row, col)
-            self._update_display()
+            self._mark_display_dirty(flags=self.game.select_cell(row, col))
 
     # Actions
     def action_move_up(self) -> None:
         """Move selection up."""
-        self.game.move_selection(-1, 0)
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.move_selection(-1, 0))
 
     def action_move_down(self) -> None:
         """Move selection down."""
-        self.game.move_selection(1, 0)
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.move_selection(1, 0))
 
     def action_move_left(self) -> None:
         """Move selection left."""
-        self.game.move_selection(0, -1)
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.move_selection(0, -1))
 
     def action_move_right(self) -> None:
         """Move selection right."""
-        self.game.move_selection(0, 1)
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.move_selection(0, 1))
 
     def action_digit(self, digit: int) -> None:
         """Enter a digit."""
-        if self.game.selected_cell:
-            row, col = self.game.selected_cell
-            self.game.make_move(row, col, digit)
-            self._update_display()
+        if self.game.selected_cell >= 0:
+            row, col = divmod(self.game.selected_cell, 9)
+            flags = self.game.make_move(row, col, digit)
+            self._mark_display_dirty((row, col), flags)
             self._check_completion()
 
     def action_clear_cell(self) -> None:
         """Clear the selected cell."""
-        if self.game.selected_cell:
-            row, col = self.game.selected_cell
-            self.game.clear_cell(row, col)
-            self._update_display()
+        if self.game.selected_cell >= 0:
+            row, col = divmod(self.game.selected_cell, 9)
+            flags = self.game.clear_cell(row, col)
+            self._mark_display_dirty((row, col), flags)
 
     def action_toggle_notes(self) -> None:
         """Toggle notes mode."""
-        self.game.toggle_notes_mode()
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.toggle_notes_mode())
 
     def action_undo(self) -> None:
         """Undo last move."""
-        self.game.undo()
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.undo())
 
     def action_redo(self) -> None:
         """Redo last undone move."""
-        self.game.redo()
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.redo())
 
     def action_hint(self) -> None:
         """Apply a hint."""
@@ -355,28 +416,27 @@ class SudokuApp(App):
         if hint:
             row, col, _ = hint
             self.game.select_cell(row, col)
-        self._update_display()
+            self._mark_display_dirty(flags=DIRTY_BOARD)
         self._check_completion()
 
     def action_next_empty(self) -> None:
         """Move to next empty cell."""
-        self.game.move_to_next_empty()
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.move_to_next_empty())
 
     def action_prev_empty(self) -> None:
         """Move to previous empty cell."""
-        self.game.move_to_next_empty(reverse=True)
-        self._update_display()
+        self._mark_display_dirty(flags=self.game.move_to_next_empty(reverse=True))
 
     def action_new_game(self) -> None:
         """Start a new game with current difficulty."""
         self.game.new_game(self.game.difficulty)
-        self._update_display()
+        self._mark_display_dirty()
         self._update_best_time()
         if self.completion_banner:
             self.completion_banner.remove_class("visible")
 
     def action_deselect(self) -> None:
         """Deselect current cell."""
-        self.game.selected_cell = None
-        self._update_display()
+        if self.game.selected_cell >= 0:
+            self.game.selected_cell = -1
+            self._mark_display_dirty(flags=DIRTY_BOARD)
@@ -1,5 +1,13 @@
 from models.board import Board
-from models.generator import generate_puzzle, Difficulty
+from models.difficulty import Difficulty
 from models.game import GameState, Move
 
 __all__ = ["Board", "generate_puzzle", "GameState", "Move", "Difficulty"]
+
+
+def __getattr__(name):
+    # Deferred so importing the package doesn't pull in the generator
+    if name == "generate_puzzle":
+        from models.generator import generate_puzzle
+        return generate_puzzle
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,44 +1,170 @@
 """Sudoku board model with validation logic."""
 
+from array import array
+from bisect import bisect_left, bisect_right, insort
 from typing import Optional
-from copy import deepcopy
+
+# Bitmask with bits 1-9 set: all nine digits present in a unit
+FULL_MASK = 0x3FE
+
+
+def _build_peers() -> tuple[tuple[int, ...], ...]:
+    """Build each cell's peer indices (flat, the cell itself excluded)."""
+    all_peers = []
+    for i in range(81):
+        row, col = divmod(i, 9)
+        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
+        peers = {row * 9 + c for c in range(9)}
+        peers |= {r * 9 + col for r in range(9)}
+        peers |= {r * 9 + c
+                  for r in range(box_row, box_row + 3)
+                  for c in range(box_col, box_col + 3)}
+        peers.discard(i)
+        all_peers.append(tuple(sorted(peers)))
+    return tuple(all_peers)
+
+
+# The 20 cells sharing a row, column, or box with each cell
+ALL_PEERS = _build_peers()
 
 
 class Board:
     """Represents a Sudoku board with validation and state tracking."""
 
     def __init__(self):
-        # 9x9 grid, 0 means empty
-        self.initial_values: list[list[int]] = [[0] * 9 for _ in range(9)]
-        self.current_values: list[list[int]] = [[0] * 9 for _ in range(9)]
-        # Notes: set of candidate digits for each cell
-        self.notes: list[list[set[int]]] = [[set() for _ in range(9)] for _ in range(9)]
+        # Bumped on every mutation so callers can cache derived state
+        self.version: int = 0
+        # Flat 81-byte buffers indexed by row * 9 + col, 0 means empty
+        self.initial_values: array = array("B", bytes(81))
+        self.current_values: array = array("B", bytes(81))
+        # Notes: 9-bit candidate mask per cell, bit d-1 set if digit d is noted
+        self.notes: array = array("H", bytes(162))
+        # Presence bitmasks per row/column/box: bit d set if digit d occurs.
+        # Backed by per-unit occurrence counts so the masks stay correct
+        # when the player places conflicting duplicates.
+        self.row_mask: list[int] = [0] * 9
+        self.col_mask: list[int] = [0] * 9
+        self.box_mask: list[int] = [0] * 9
+        self._row_counts = [bytearray(10) for _ in range(9)]
+        self._col_counts = [bytearray(10) for _ in range(9)]
+        self._box_counts = [bytearray(10) for _ in range(9)]
+        # Flat indices of cells involved in a duplicate, kept current by
+        # _add_digit/_remove_digit
+        self._conflicts: set[int] = set()
+        # Sorted flat indices of empty cells, maintained by set_value
+        self._empty: list[int] = list(range(81))
+        # Decoded (row, col) positions, rebuilt lazily when _empty changes
+        self._empty_positions: Optional[list[tuple[int, int]]] = None
 
     def load_puzzle(self, puzzle: list[list[int]]) -> None:
         """Load a puzzle into the board."""
-        self.initial_values = deepcopy(puzzle)
-        self.current_values = deepcopy(puzzle)
-        self.notes = [[set() for _ in range(9)] for _ in range(9)]
+        flat = array("B", (value for row in puzzle for value in row))
+        self.version += 1
+        self.initial_values = flat
+        self.current_values = array("B", flat)
+        self.notes = array("H", bytes(162))
+        self.row_mask = [0] * 9
+        self.col_mask = [0] * 9
+        self.box_mask = [0] * 9
+        self._row_counts = [bytearray(10) for _ in range(9)]
+        self._col_counts = [bytearray(10) for _ in range(9)]
+        self._box_counts = [bytearray(10) for _ in range(9)]
+        self._conflicts = set()
+        self._empty = [i for i in range(81) if flat[i] == 0]
+        self._empty_positions = None
+        for row in range(9):
+            for col in range(9):
+                value = puzzle[row][col]
+                if value != 0:
+                    self._add_digit(row, col, value)
+
+    def _add_digit(self, row: int, col: int, value: int) -> None:
+        """Record a placed digit in the row/col/box masks and conflicts."""
+        box = 3 * (row // 3) + col // 3
+        bit = 1 << value
+        self._row_counts[row][value] += 1
+        self._col_counts[col][value] += 1
+        self._box_counts[box][value] += 1
+        self.row_mask[row] |= bit
+        self.col_mask[col] |= bit
+        self.box_mask[box] |= bit
+        if (self._row_counts[row][value] > 1
+                or self._col_counts[col][value] > 1
+                or self._box_counts[box][value] > 1):
+            index = row * 9 + col
+            cv = self.current_values
+            self._conflicts.add(index)
+            for p in ALL_PEERS[index]:
+                if cv[p] == value:
+                    self._conflicts.add(p)
+
+    def _remove_digit(self, row: int, col: int, value: int) -> None:
+        """Remove a placed digit from the row/col/box masks and conflicts."""
+        box = 3 * (row // 3) + col // 3
+        bit = 1 << value
+        self._row_counts[row][value] -= 1
+        self._col_counts[col][value] -= 1
+        self._box_counts[box][value] -= 1
+        if self._row_counts[row][value] == 0:
+            self.row_mask[row] &= ~bit
+        if self._col_counts[col][value] == 0:
+            self.col_mask[col] &= ~bit
+        if self._box_counts[box][value] == 0:
+            self.box_mask[box] &= ~bit
+        index = row * 9 + col
+        if self._conflicts:
+            self._conflicts.discard(index)
+            cv = self.current_values
+            for p in ALL_PEERS[index]:
+                if cv[p] == value and p in self._conflicts \
+                        and not self._cell_conflicted(p):
+                    self._conflicts.discard(p)
+
+    def _cell_conflicted(self, index: int) -> bool:
+        """Check whether the cell's digit duplicates any unit it sits in."""
+        value = self.current_values[index]
+        row, col = divmod(index, 9)
+        box = 3 * (row // 3) + col // 3
+        return (self._row_counts[row][value] > 1
+                or self._col_counts[col][value] > 1
+                or self._box_counts[box][value] > 1)
+
+    @property
+    def conflicts(self) -> set[int]:
+        """Flat indices of all cells currently involved in a duplicate."""
+        return self._conflicts
 
     def get_value(self, row: int, col: int) -> int:
         """Get the current value at a position."""
-        return self.current_values[row][col]
+        return self.current_values[row * 9 + col]
 
     def set_value(self, row: int, col: int, value: int) -> bool:
         """
         Set a value at a position.
         Returns False if the cell is a given clue (immutable).
         """
-        if self.initial_values[row][col] != 0:
+        index = row * 9 + col
+        if self.initial_values[index] != 0:
             return False
-        self.current_values[row][col] = value
+        self.version += 1
+        old_value = self.current_values[index]
+        if old_value != 0:
+            self._remove_digit(row, col, old_value)
+        self.current_values[index] = value
         if value != 0:
-            self.notes[row][col].clear()
+            self._add_digit(row, col, value)
+            self.notes[index] = 0
+            if old_value == 0:
+                del self._empty[bisect_left(self._empty, index)]
+                self._empty_positions = None
+        elif old_value != 0:
+            insort(self._empty, index)
+            self._empty_positions = None
         return True
 
     def is_given(self, row: int, col: int) -> bool:
         """Check if a cell contains a given clue."""
-        return self.initial_values[row][col] != 0
+        return self.initial_values[row * 9 + col] != 0
 
     def clear_cell(self, row: int, col: int) -> bool:
         """Clear a cell. Returns False if it's a given clue."""
@@ -46,133 +172,108 @@ class Board:
 
     def toggle_note(self, row: int, col: int, digit: int) -> bool:
         """Toggle a note digit in a cell. Returns False if cell has a value."""
-        if self.current_values[row][col] != 0:
+        index = row * 9 + col
+        if self.current_values[index] != 0:
             return False
-        if digit in self.notes[row][col]:
-            self.notes[row][col].remove(digit)
-        else:
-            self.notes[row][col].add(digit)
+        self.version += 1
+        self.notes[index] ^= 1 << (digit - 1)
         return True
 
     def get_notes(self, row: int, col: int) -> set[int]:
         """Get notes for a cell."""
-        return self.notes[row][col].copy()
+        mask = self.notes[row * 9 + col]
+        return {d for d in range(1, 10) if mask & (1 << (d - 1))}
 
     def is_valid_placement(self, row: int, col: int, value: int) -> bool:
         """Check if placing a value at position would be valid."""
         if value == 0:
             return True
 
-        # Check row
-        for c in range(9):
-            if c != col and self.current_values[row][c] == value:
-                return False
-
-        # Check column
-        for r in range(9):
-            if r != row and self.current_values[r][col] == value:
-                return False
-
-        # Check 3x3 box
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for r in range(box_row, box_row + 3):
-            for c in range(box_col, box_col + 3):
-                if (r, c) != (row, col) and self.current_values[r][c] == value:
-                    return False
+        box = 3 * (row // 3) + col // 3
+        bit = 1 << value
+        if not ((self.row_mask[row] | self.col_mask[col] | self.box_mask[box]) & bit):
+            return True
 
-        return True
+        # The digit is somewhere in a shared unit; it may just be this cell.
+        if self.current_values[row * 9 + col] != value:
+            return False
+        return (self._row_counts[row][value] == 1
+                and self._col_counts[col][value] == 1
+                and self._box_counts[box][value] == 1)
 
     def get_conflicts(self, row: int, col: int) -> list[tuple[int, int]]:
         """Get list of cells that conflict with the value at given position."""
-        conflicts = []
-        value = self.current_values[row][col]
+        cv = self.current_values
+        index = row * 9 + col
+        value = cv[index]
 
-        if value == 0:
-            return conflicts
-
-        # Check row
-        for c in range(9):
-            if c != col and self.current_values[row][c] == value:
-                conflicts.append((row, c))
-
-        # Check column
-        for r in range(9):
-            if r != row and self.current_values[r][col] == value:
-                conflicts.append((r, col))
-
-        # Check 3x3 box
-        box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-        for r in range(box_row, box_row + 3):
-            for c in range(box_col, box_col + 3):
-                if (r, c) != (row, col) and self.current_values[r][c] == value:
-                    if (r, c) not in conflicts:
-                        conflicts.append((r, c))
+        # Early out via the incrementally maintained conflict set
+        if value == 0 or index not in self._conflicts:
+            return []
 
-        return conflicts
+        return [divmod(p, 9) for p in ALL_PEERS[index] if cv[p] == value]
 
     def get_same_digit_positions(self, digit: int) -> list[tuple[int, int]]:
         """Get all positions containing the given digit."""
         if digit == 0:
             return []
-        positions = []
-        for r in range(9):
-            for c in range(9):
-                if self.current_values[r][c] == digit:
-                    positions.append((r, c))
-        return positions
-
-    def get_digit_counts(self) -> dict[int, int]:
-        """Get count of each digit on the board."""
-        counts = {i: 0 for i in range(1, 10)}
-        for row in self.current_values:
-            for val in row:
-                if val != 0:
-                    counts[val] += 1
+        return [divmod(i, 9) for i, v in enumerate(self.current_values) if v == digit]
+
+    def get_digit_counts(self) -> list[int]:
+        """
+        Get the count of each digit on the board as a list indexed by
+        digit (index 0 holds the number of empty cells).
+        """
+        counts = [0] * 10
+        for value in self.current_values:
+            counts[value] += 1
         return counts
 
     def is_complete(self) -> bool:
         """Check if the puzzle is completely and correctly solved."""
-        # Check all cells are filled
-        for row in self.current_values:
-            if 0 in row:
-                return False
-
-        # Check all rows
-        for row in self.current_values:
-            if len(set(row)) != 9:
-                return False
-
-        # Check all columns
-        for col in range(9):
-            column = [self.current_values[row][col] for row in range(9)]
-            if len(set(column)) != 9:
-                return False
-
-        # Check all 3x3 boxes
-        for box_row in range(3):
-            for box_col in range(3):
-                box = []
-                for r in range(3):
-                    for c in range(3):
-                        box.append(self.current_values[box_row * 3 + r][box_col * 3 + c])
-                if len(set(box)) != 9:
-                    return False
-
-        return True
+        # Cheapest test first: any empty cell means not complete. Full row
+        # masks alone don't imply valid columns/boxes, so check all three.
+        if self._empty:
+            return False
+        return (all(m == FULL_MASK for m in self.row_mask)
+                and all(m == FULL_MASK for m in self.col_mask)
+                and all(m == FULL_MASK for m in self.box_mask))
 
     def get_empty_cells(self) -> list[tuple[int, int]]:
-        """Get list of empty cell positions."""
-        empty = []
-        for r in range(9):
-            for c in range(9):
-                if self.current_values[r][c] == 0:
-                    empty.append((r, c))
-        return empty
+        """Get list of empty cell positions (cached; treat as read-only)."""
+        if self._empty_positions is None:
+            self._empty_positions = [divmod(i, 9) for i in self._empty]
+        return self._empty_positions
+
+    def next_empty_index(self, index: int, reverse: bool = False) -> Optional[int]:
+        """
+        Get the flat index of the nearest empty cell strictly after (or,
+        with reverse, before) the given index, wrapping around.
+        Returns None if the board has no empty cells.
+        """
+        empties = self._empty
+        if not empties:
+            return None
+        if reverse:
+            pos = bisect_left(empties, index) - 1
+            return empties[pos] if pos >= 0 else empties[-1]
+        pos = bisect_right(empties, index)
+        return empties[pos] if pos < len(empties) else empties[0]
 
     def copy(self) -> "Board":
         """Create a deep copy of the board."""
         new_board = Board()
-        new_board.initial_values = deepcopy(self.initial_values)
-        new_board.current_values = deepcopy(self.current_values)
-        new_board.notes = deepcopy(self.notes)
+        new_board.version = self.version
+        new_board.initial_values = array("B", self.initial_values)
+        new_board.current_values = array("B", self.current_values)
+        new_board.notes = array("H", self.notes)
+        new_board.row_mask = self.row_mask[:]
+        new_board.col_mask = self.col_mask[:]
+        new_board.box_mask = self.box_mask[:]
+        new_board._row_counts = [bytearray(c) for c in self._row_counts]
+        new_board._col_counts = [bytearray(c) for c in self._col_counts]
+        new_board._box_counts = [bytearray(c) for c in self._box_counts]
+        new_board._conflicts = self._conflicts.copy()
+        new_board._empty = self._empty[:]
+        new_board._empty_positions = None
         return new_board
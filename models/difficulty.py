@@ -0,0 +1,10 @@
+"""Difficulty levels for puzzle generation."""
+
+from enum import Enum
+
+
+class Difficulty(Enum):
+    EASY = "easy"
+    MEDIUM = "medium"
+    HARD = "hard"
+    EXPERT = "expert"
@@ -1,22 +1,39 @@
 """Game state management including timer, history, and moves."""
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass
 from typing import Optional
 from copy import deepcopy
 
 from models.board import Board
-from models.generator import Difficulty, generate_puzzle, get_hint
+from models.difficulty import Difficulty
 
+# Maximum number of moves kept for undo/redo
+HISTORY_LIMIT = 512
 
-@dataclass
+# Dirty bits returned by state-changing methods, telling the app which
+# display areas need redrawing (DIRTY_NONE means nothing changed)
+DIRTY_NONE = 0
+DIRTY_GRID = 1
+DIRTY_STATS = 2
+DIRTY_NUMPAD = 4
+DIRTY_CONTROLS = 8
+DIRTY_ALL = DIRTY_GRID | DIRTY_STATS | DIRTY_NUMPAD | DIRTY_CONTROLS
+
+# A board edit touches the grid plus both digit-count displays
+DIRTY_BOARD = DIRTY_GRID | DIRTY_STATS | DIRTY_NUMPAD
+
+
+@dataclass(slots=True)
 class Move:
     """Represents a single move for undo/redo."""
     row: int
     col: int
     old_value: int
     new_value: int
-    old_notes: set[int] = field(default_factory=set)
-    new_notes: set[int] = field(default_factory=set)
+    # Note bitmasks (bit d-1 set if digit d is noted), matching Board.notes
+    old_notes: int = 0
+    new_notes: int = 0
 
 
 class GameState:
@@ -27,53 +44,64 @@ class GameState:
         self.solution: list[list[int]] = []
         self.difficulty: Difficulty = Difficulty.MEDIUM
         self.timer: float = 0.0
-        self.history: list[Move] = []
+        self.history: deque[Move] = deque(maxlen=HISTORY_LIMIT)
         self.history_index: int = -1
         self.notes_mode: bool = False
         self.is_paused: bool = False
         self.is_complete: bool = False
-        self.selected_cell: Optional[tuple[int, int]] = None
+        # Flat index of the selected cell, -1 when nothing is selected
+        self.selected_cell: int = -1
+        # Memoized (whole seconds, formatted string) for format_time
+        self._time_cache: Optional[tuple[int, str]] = None
 
     def new_game(self, difficulty: Difficulty) -> None:
         """Start a new game with the given difficulty."""
+        # Deferred so importing the game state doesn't pull in the
+        # backtracking generator before it's needed
+        from models.generator import generate_puzzle
+
         self.difficulty = difficulty
         puzzle, solution = generate_puzzle(difficulty)
         self.solution = solution
         self.board = Board()
         self.board.load_puzzle(puzzle)
         self.timer = 0.0
-        self.history = []
+        self.history.clear()
         self.history_index = -1
         self.notes_mode = False
         self.is_paused = False
         self.is_complete = False
-        self.selected_cell = (0, 0)
+        self.selected_cell = 0
+        self._time_cache = None
 
-    def make_move(self, row: int, col: int, value: int) -> bool:
+    def make_move(self, row: int, col: int, value: int) -> int:
         """
         Make a move at the given position.
-        Returns True if move was made, False if cell is a given clue.
+        Returns a DIRTY_* bitmask of display areas that changed
+        (DIRTY_NONE if the cell is a given clue or the game is over).
         """
         if self.is_complete or self.board.is_given(row, col):
-            return False
+            return DIRTY_NONE
 
+        index = row * 9 + col
         old_value = self.board.get_value(row, col)
-        old_notes = self.board.get_notes(row, col)
+        old_notes = self.board.notes[index]
 
         if self.notes_mode and value != 0:
             # Toggle note
             self.board.toggle_note(row, col, value)
-            new_notes = self.board.get_notes(row, col)
+            new_notes = self.board.notes[index]
             move = Move(row, col, old_value, old_value, old_notes, new_notes)
+            dirty = DIRTY_GRID if new_notes != old_notes else DIRTY_NONE
         else:
             # Set value
             self.board.set_value(row, col, value)
-            new_notes = set()
-            move = Move(row, col, old_value, value, old_notes, new_notes)
+            move = Move(row, col, old_value, value, old_notes, 0)
+            dirty = DIRTY_BOARD
 
         # Truncate future history if we're not at the end
-        if self.history_index < len(self.history) - 1:
-            self.history = self.history[:self.history_index + 1]
+        while len(self.history) > self.history_index + 1:
+            self.history.pop()
 
         self.history.append(move)
         self.history_index = len(self.history) - 1
@@ -82,37 +110,39 @@ class GameState:
         if self.board.is_complete():
             self.is_complete = True
 
-        return True
+        return dirty
 
-    def undo(self) -> bool:
-        """Undo the last move. Returns True if successful."""
+    def undo(self) -> int:
+        """Undo the last move. Returns a DIRTY_* bitmask of changed areas."""
         if self.history_index < 0:
-            return False
+            return DIRTY_NONE
 
         move = self.history[self.history_index]
         self.board.set_value(move.row, move.col, move.old_value)
-        self.board.notes[move.row][move.col] = move.old_notes.copy()
+        self.board.notes[move.row * 9 + move.col] = move.old_notes
         self.history_index -= 1
         self.is_complete = False
-        return True
+        return DIRTY_BOARD
 
-    def redo(self) -> bool:
-        """Redo a previously undone move. Returns True if successful."""
+    def redo(self) -> int:
+        """Redo a previously undone move. Returns a DIRTY_* bitmask."""
         if self.history_index >= len(self.history) - 1:
-            return False
+            return DIRTY_NONE
 
         self.history_index += 1
         move = self.history[self.history_index]
         self.board.set_value(move.row, move.col, move.new_value)
-        self.board.notes[move.row][move.col] = move.new_notes.copy()
+        self.board.notes[move.row * 9 + move.col] = move.new_notes
 
         if self.board.is_complete():
             self.is_complete = True
 
-        return True
+        return DIRTY_BOARD
 
     def get_hint(self) -> Optional[tuple[int, int, int]]:
         """Get a hint. Returns (row, col, value) or None."""
+        from models.generator import get_hint
+
         return get_hint(self.board.current_values, self.solution)
 
     def apply_hint(self) -> Optional[tuple[int, int, int]]:
@@ -127,88 +157,98 @@ class GameState:
             self.notes_mode = old_notes_mode
         return hint
 
-    def toggle_notes_mode(self) -> None:
-        """Toggle notes mode on/off."""
+    def toggle_notes_mode(self) -> int:
+        """Toggle notes mode on/off. Returns a DIRTY_* bitmask."""
         self.notes_mode = not self.notes_mode
+        return DIRTY_CONTROLS
 
-    def clear_cell(self, row: int, col: int) -> bool:
-        """Clear a cell. Returns True if successful."""
+    def clear_cell(self, row: int, col: int) -> int:
+        """Clear a cell. Returns a DIRTY_* bitmask of changed areas."""
         if self.board.is_given(row, col):
-            return False
+            return DIRTY_NONE
 
+        index = row * 9 + col
         old_value = self.board.get_value(row, col)
-        old_notes = self.board.get_notes(row, col)
+        old_notes = self.board.notes[index]
 
-        self.board.set_value(row, col, 0)
-        self.board.notes[row][col].clear()
+        # Nothing to clear: no state change, no history entry
+        if old_value == 0 and not old_notes:
+            return DIRTY_NONE
 
-        # Only add to history if there was something to clear
-        if old_value != 0 or old_notes:
-            move = Move(row, col, old_value, 0, old_notes, set())
-            if self.history_index < len(self.history) - 1:
-                self.history = self.history[:self.history_index + 1]
-            self.history.append(move)
-            self.history_index = len(self.history) - 1
+        self.board.set_value(row, col, 0)
+        self.board.notes[index] = 0
 
-        return True
+        move = Move(row, col, old_value, 0, old_notes, 0)
+        while len(self.history) > self.history_index + 1:
+            self.history.pop()
+        self.history.append(move)
+        self.history_index = len(self.history) - 1
 
-    def select_cell(self, row: int, col: int) -> None:
-        """Select a cell."""
-        if 0 <= row < 9 and 0 <= col < 9:
-            self.selected_cell = (row, col)
+        return DIRTY_BOARD
 
-    def move_selection(self, dr: int, dc: int) -> None:
-        """Move selection by delta."""
-        if self.selected_cell is None:
-            self.selected_cell = (0, 0)
-            return
+    @property
+    def selected_rowcol(self) -> Optional[tuple[int, int]]:
+        """Selected cell as (row, col), or None when nothing is selected."""
+        if self.selected_cell < 0:
+            return None
+        return divmod(self.selected_cell, 9)
 
-        row, col = self.selected_cell
+    def select_cell(self, row: int, col: int) -> int:
+        """Select a cell. Returns a DIRTY_* bitmask."""
+        if 0 <= row < 9 and 0 <= col < 9:
+            index = row * 9 + col
+            if index != self.selected_cell:
+                self.selected_cell = index
+                return DIRTY_BOARD
+        return DIRTY_NONE
+
+    def move_selection(self, dr: int, dc: int) -> int:
+        """Move selection by delta. Returns a DIRTY_* bitmask."""
+        if self.selected_cell < 0:
+            self.selected_cell = 0
+            return DIRTY_BOARD
+
+        row, col = divmod(self.selected_cell, 9)
         new_row = max(0, min(8, row + dr))
         new_col = max(0, min(8, col + dc))
-        self.selected_cell = (new_row, new_col)
-
-    def move_to_next_empty(self, reverse: bool = False) -> None:
-        """Move selection to next empty cell."""
-        if self.selected_cell is None:
-            self.selected_cell = (0, 0)
-
-        empty_cells = self.board.get_empty_cells()
-        if not empty_cells:
-            return
-
-        if reverse:
-            empty_cells.reverse()
-
-        current = self.selected_cell
-        # Find next empty cell after current
-        for cell in empty_cells:
-            if reverse:
-                if cell < current:
-                    self.selected_cell = cell
-                    return
-            else:
-                if cell > current:
-                    self.selected_cell = cell
-                    return
-
-        # Wrap around
-        self.selected_cell = empty_cells[0]
+        index = new_row * 9 + new_col
+        if index == self.selected_cell:
+            return DIRTY_NONE
+        self.selected_cell = index
+        return DIRTY_BOARD
+
+    def move_to_next_empty(self, reverse: bool = False) -> int:
+        """Move selection to next empty cell. Returns a DIRTY_* bitmask."""
+        changed = False
+        if self.selected_cell < 0:
+            self.selected_cell = 0
+            changed = True
+
+        index = self.board.next_empty_index(self.selected_cell, reverse)
+        if index is not None and index != self.selected_cell:
+            self.selected_cell = index
+            changed = True
+        return DIRTY_BOARD if changed else DIRTY_NONE
 
     def get_selected_digit(self) -> int:
         """Get the digit in the currently selected cell."""
-        if self.selected_cell is None:
+        if self.selected_cell < 0:
             return 0
-        row, col = self.selected_cell
-        return self.board.get_value(row, col)
+        return self.board.current_values[self.selected_cell]
 
     def format_time(self) -> str:
         """Format the timer as MM:SS or HH:MM:SS."""
         total_seconds = int(self.timer)
+        if self._time_cache is not None and self._time_cache[0] == total_seconds:
+            return self._time_cache[1]
+
         hours = total_seconds // 3600
         minutes = (total_seconds % 3600) // 60
         seconds = total_seconds % 60
 
         if hours > 0:
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes:02d}:{seconds:02d}"
+            formatted = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        else:
+            formatted = f"{minutes:02d}:{seconds:02d}"
+        self._time_cache = (total_seconds, formatted)
+        return formatted
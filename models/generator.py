@@ -1,15 +1,8 @@
 """Sudoku puzzle generator with difficulty levels."""
 
 import random
-from copy import deepcopy
-from enum import Enum
 
-
-class Difficulty(Enum):
-    EASY = "easy"
-    MEDIUM = "medium"
-    HARD = "hard"
-    EXPERT = "expert"
+from models.difficulty import Difficulty
 
 
 # Number of clues to leave based on difficulty
@@ -35,135 +28,313 @@ def generate_puzzle(difficulty: Difficulty = Difficulty.MEDIUM) -> tuple[list[li
     return puzzle, solution
 
 
-def _generate_solved_board() -> list[list[int]]:
-    """Generate a completely filled valid Sudoku board."""
-    board = [[0] * 9 for _ in range(9)]
-    _fill_board(board)
-    return board
+# Box index of each flat cell position
+_BOX_OF = tuple(3 * (r // 3) + c // 3 for r in range(9) for c in range(9))
 
+# Candidate mask with bits 1-9 set: all nine digits still possible
+_ALL_DIGITS = 0x3FE
+
+# A dedicated Random instance with its bound methods hoisted to module
+# level, so RNG draws in the hot loops skip the module-attribute dispatch
+_rng = random.Random()
+_getrandbits = _rng.getrandbits
+_randint = _rng.randint
+_sample = _rng.sample
+_shuffle = _rng.shuffle
+
+# Precomputed random digit orderings for _fill_board, so each search node
+# picks one with getrandbits instead of allocating and shuffling a list.
+# A slightly coarser randomness is fine: the solved board only needs to
+# vary between games, not be perfectly uniform.
+_PERMS = tuple(tuple(_sample(range(1, 10), 9)) for _ in range(256))
 
-def _fill_board(board: list[list[int]]) -> bool:
-    """Fill the board using backtracking with randomization."""
-    # Find next empty cell
-    for row in range(9):
-        for col in range(9):
-            if board[row][col] == 0:
-                # Try digits in random order
-                digits = list(range(1, 10))
-                random.shuffle(digits)
 
-                for digit in digits:
-                    if _is_valid(board, row, col, digit):
-                        board[row][col] = digit
-                        if _fill_board(board):
-                            return True
-                        board[row][col] = 0
+class _Enough(Exception):
+    """Raised to unwind the solution search once the limit is reached."""
 
-                return False
 
-    return True  # Board is complete
+def _make_masks(cells: bytearray) -> tuple[list[int], list[int], list[int]]:
+    """Build row/col/box digit-presence bitmasks for a flat board."""
+    rows = [0] * 9
+    cols = [0] * 9
+    boxes = [0] * 9
+    for i, digit in enumerate(cells):
+        if digit:
+            bit = 1 << digit
+            rows[i // 9] |= bit
+            cols[i % 9] |= bit
+            boxes[_BOX_OF[i]] |= bit
+    return rows, cols, boxes
 
 
-def _is_valid(board: list[list[int]], row: int, col: int, digit: int) -> bool:
-    """Check if placing digit at (row, col) is valid."""
-    # Check row
-    if digit in board[row]:
-        return False
+def _find_mrv_cell(cells: bytearray, rows: list[int], cols: list[int],
+                   boxes: list[int]) -> tuple[int, int]:
+    """
+    Find the empty cell with the fewest legal candidates (MRV heuristic).
+    Returns (position, candidate mask): (-1, 0) if the board is full, or a
+    position with mask 0 if some empty cell has no candidates (dead end).
+    """
+    best = -1
+    best_cand = 0
+    best_n = 10
+    for i in range(81):
+        if cells[i] == 0:
+            cand = ~(rows[i // 9] | cols[i % 9] | boxes[_BOX_OF[i]]) & _ALL_DIGITS
+            n = cand.bit_count()
+            if n < best_n:
+                best, best_cand, best_n = i, cand, n
+                if n <= 1:
+                    break
+    return best, best_cand
+
+
+# One solved board, filled lazily on first use; every solution after
+# that is derived from it by validity-preserving transformations
+_base_solution: bytes | None = None
 
-    # Check column
-    if digit in [board[r][col] for r in range(9)]:
-        return False
 
-    # Check 3x3 box
-    box_row, box_col = 3 * (row // 3), 3 * (col // 3)
-    for r in range(box_row, box_row + 3):
-        for c in range(box_col, box_col + 3):
-            if board[r][c] == digit:
-                return False
+def _generate_solved_board() -> list[list[int]]:
+    """Generate a completely filled valid Sudoku board."""
+    global _base_solution
+    if _base_solution is None:
+        cells = bytearray(81)
+        _fill_board(cells, [0] * 9, [0] * 9, [0] * 9)
+        _base_solution = bytes(cells)
+
+    # Relabelling the digits, permuting rows within each 3-row band,
+    # permuting the bands, and the same for columns/stacks all preserve
+    # validity, so a fresh board is a table shuffle instead of a new
+    # backtracking fill. The transformation group has ~10^12 elements,
+    # which is plenty of variety for the removal step to work on.
+    relabel = [0] + _sample(range(1, 10), 9)
+    row_order = [3 * band + r
+                 for band in _sample(range(3), 3)
+                 for r in _sample(range(3), 3)]
+    col_order = [3 * stack + c
+                 for stack in _sample(range(3), 3)
+                 for c in _sample(range(3), 3)]
+    base = _base_solution
+    return [[relabel[base[r * 9 + c]] for c in col_order] for r in row_order]
+
+
+def _fill_board(cells: bytearray, rows: list[int], cols: list[int],
+                boxes: list[int]) -> bool:
+    """Fill the flat board using randomized MRV backtracking."""
+    pos, cand = _find_mrv_cell(cells, rows, cols, boxes)
+    if pos < 0:
+        return True  # Board is complete
+    if cand == 0:
+        return False  # Dead end
+
+    row, col = divmod(pos, 9)
+    box = _BOX_OF[pos]
+
+    # Try candidate digits in a precomputed random order
+    for digit in _PERMS[_getrandbits(8)]:
+        bit = 1 << digit
+        if not cand & bit:
+            continue
+        cells[pos] = digit
+        rows[row] ^= bit
+        cols[col] ^= bit
+        boxes[box] ^= bit
+        if _fill_board(cells, rows, cols, boxes):
+            return True
+        cells[pos] = 0
+        rows[row] ^= bit
+        cols[col] ^= bit
+        boxes[box] ^= bit
 
-    return True
+    return False
 
 
 def _create_puzzle(solution: list[list[int]], difficulty: Difficulty) -> list[list[int]]:
     """Create a puzzle by removing cells from the solution."""
-    puzzle = deepcopy(solution)
+    cells = bytearray(v for row in solution for v in row)
+    rows, cols, boxes = _make_masks(cells)
     min_clues, max_clues = DIFFICULTY_CLUES[difficulty]
-    target_clues = random.randint(min_clues, max_clues)
+    target_clues = _randint(min_clues, max_clues)
 
-    # Get all cell positions and shuffle them
-    cells = [(r, c) for r in range(9) for c in range(9)]
-    random.shuffle(cells)
+    # Remove cells in 180°-rotationally symmetric pairs: one uniqueness
+    # check validates two removals, and the clue pattern comes out
+    # symmetric. Cell 40 (the centre) is its own mate.
+    order = list(range(41))
+    _shuffle(order)
 
     current_clues = 81
-    removed = []
 
-    for row, col in cells:
-        if current_clues <= target_clues:
+    for pos in order:
+        need = current_clues - target_clues
+        if need <= 0:
             break
 
-        # Remember the value
-        value = puzzle[row][col]
-        puzzle[row][col] = 0
+        mate = 80 - pos
+        pair = (pos,) if pos == mate or need == 1 else (pos, mate)
+
+        # Remove the values in place; the solver restores its own moves,
+        # so no board copy is needed for the uniqueness check
+        removed = []
+        for p in pair:
+            value = cells[p]
+            bit = 1 << value
+            cells[p] = 0
+            rows[p // 9] ^= bit
+            cols[p % 9] ^= bit
+            boxes[_BOX_OF[p]] ^= bit
+            removed.append((p, value, bit))
 
         # Check if puzzle still has unique solution
-        if _count_solutions(deepcopy(puzzle), limit=2) != 1:
-            # Multiple solutions, restore the cell
-            puzzle[row][col] = value
+        if _has_unique_solution(cells, rows, cols, boxes):
+            current_clues -= len(pair)
         else:
-            current_clues -= 1
-            removed.append((row, col))
-
-    return puzzle
+            # Multiple solutions, restore the cells
+            for p, value, bit in removed:
+                cells[p] = value
+                rows[p // 9] ^= bit
+                cols[p % 9] ^= bit
+                boxes[_BOX_OF[p]] ^= bit
+
+    # A failed pair is restored whole, so the symmetric sweep alone can
+    # stall several clues above the target on hard/expert boards. Close
+    # the gap by retrying the remaining clues one cell at a time — the
+    # uniqueness check is cheap enough to spend on the extra passes.
+    if current_clues > target_clues:
+        singles = [p for p in range(81) if cells[p]]
+        _shuffle(singles)
+        for p in singles:
+            if current_clues <= target_clues:
+                break
+            value = cells[p]
+            bit = 1 << value
+            cells[p] = 0
+            rows[p // 9] ^= bit
+            cols[p % 9] ^= bit
+            boxes[_BOX_OF[p]] ^= bit
+            if _has_unique_solution(cells, rows, cols, boxes):
+                current_clues -= 1
+            else:
+                cells[p] = value
+                rows[p // 9] ^= bit
+                cols[p % 9] ^= bit
+                boxes[_BOX_OF[p]] ^= bit
+
+    return [list(cells[r * 9:(r + 1) * 9]) for r in range(9)]
 
 
 def _count_solutions(board: list[list[int]], limit: int = 2) -> int:
     """
-    Count the number of solutions for a puzzle.
+    Count the number of solutions for a puzzle given as a 9x9 grid.
     Stops early if count reaches limit (for efficiency).
     """
-    solutions = [0]
+    cells = bytearray(v for row in board for v in row)
+    rows, cols, boxes = _make_masks(cells)
+    return _count_masked_solutions(cells, rows, cols, boxes, limit)
 
-    def solve(b: list[list[int]]) -> bool:
-        if solutions[0] >= limit:
-            return True
 
-        # Find next empty cell
-        for row in range(9):
-            for col in range(9):
-                if b[row][col] == 0:
-                    for digit in range(1, 10):
-                        if _is_valid(b, row, col, digit):
-                            b[row][col] = digit
-                            solve(b)
-                            b[row][col] = 0
-
-                            if solutions[0] >= limit:
-                                return True
-                    return False
-
-        # No empty cells - found a solution
-        solutions[0] += 1
-        return False
-
-    solve(board)
+def _count_masked_solutions(cells: bytearray, rows: list[int], cols: list[int],
+                            boxes: list[int], limit: int) -> int:
+    """
+    Count solutions on a flat board with prebuilt masks, up to `limit`.
+    The board and masks are restored to their input state on return.
+    """
+    solutions = [0]
+
+    def solve() -> None:
+        pos, cand = _find_mrv_cell(cells, rows, cols, boxes)
+        if pos < 0:
+            # No empty cells - found a solution
+            solutions[0] += 1
+            if solutions[0] >= limit:
+                raise _Enough
+            return
+
+        row, col = divmod(pos, 9)
+        box = _BOX_OF[pos]
+        # Iterate candidate digits by extracting the lowest set bit
+        while cand:
+            bit = cand & -cand
+            cand &= cand - 1
+            cells[pos] = bit.bit_length() - 1
+            rows[row] ^= bit
+            cols[col] ^= bit
+            boxes[box] ^= bit
+            solve()
+            cells[pos] = 0
+            rows[row] ^= bit
+            cols[col] ^= bit
+            boxes[box] ^= bit
+
+    # The raise skips the symmetric undo on every frame it unwinds, so
+    # snapshot the inputs and restore them if the search is cut short
+    saved = (cells[:], rows[:], cols[:], boxes[:])
+    try:
+        solve()
+    except _Enough:
+        cells[:], rows[:], cols[:], boxes[:] = saved
     return solutions[0]
 
 
-def get_hint(puzzle: list[list[int]], solution: list[list[int]]) -> tuple[int, int, int] | None:
+def _has_unique_solution(cells: bytearray, rows: list[int], cols: list[int],
+                         boxes: list[int]) -> bool:
+    """
+    Decide whether a flat board with prebuilt masks has exactly one
+    solution, stopping the moment a second one turns up. This is the
+    hottest generator call (once per removal attempt in _create_puzzle),
+    so it keeps a plain int counter instead of _count_masked_solutions'
+    boxed list. The board and masks are restored on return.
+    """
+    count = 0
+
+    def solve() -> None:
+        nonlocal count
+        pos, cand = _find_mrv_cell(cells, rows, cols, boxes)
+        if pos < 0:
+            count += 1
+            if count == 2:
+                raise _Enough
+            return
+
+        row, col = divmod(pos, 9)
+        box = _BOX_OF[pos]
+        while cand:
+            bit = cand & -cand
+            cand &= cand - 1
+            cells[pos] = bit.bit_length() - 1
+            rows[row] ^= bit
+            cols[col] ^= bit
+            boxes[box] ^= bit
+            solve()
+            cells[pos] = 0
+            rows[row] ^= bit
+            cols[col] ^= bit
+            boxes[box] ^= bit
+
+    saved = (cells[:], rows[:], cols[:], boxes[:])
+    try:
+        solve()
+    except _Enough:
+        cells[:], rows[:], cols[:], boxes[:] = saved
+    return count == 1
+
+
+def get_hint(values, solution: list[list[int]]) -> tuple[int, int, int] | None:
     """
     Get a hint for the puzzle.
+    `values` is the board's flat 81-cell buffer (indexed by row * 9 + col).
     Returns (row, col, value) for one empty or incorrect cell, or None if solved.
     """
-    # First check for incorrect cells
-    for row in range(9):
-        for col in range(9):
-            if puzzle[row][col] != 0 and puzzle[row][col] != solution[row][col]:
-                return (row, col, solution[row][col])
-
-    # Then find an empty cell
+    # One pass: return the first incorrect cell, remembering the first
+    # empty one as a fallback
+    first_empty = None
     for row in range(9):
+        base = row * 9
+        solution_row = solution[row]
         for col in range(9):
-            if puzzle[row][col] == 0:
-                return (row, col, solution[row][col])
-
-    return None
+            value = values[base + col]
+            if value == 0:
+                if first_empty is None:
+                    first_empty = (row, col, solution_row[col])
+            elif value != solution_row[col]:
+                return (row, col, solution_row[col])
+
+    return first_empty
@@ -1,6 +1,7 @@
 """Persistence for best times."""
 
 import json
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -12,7 +13,15 @@ class Storage:
 
     def __init__(self, path: Optional[Path] = None):
         self.path = path or self.DEFAULT_PATH
-        self._data = self._load()
+        # Loaded on first access, keeping the disk read and JSON parse
+        # off the startup path; best times aren't needed until a game ends
+        self._data: Optional[dict] = None
+
+    def _ensure_loaded(self) -> dict:
+        """Load the data file on first use."""
+        if self._data is None:
+            self._data = self._load()
+        return self._data
 
     def _load(self) -> dict:
         """Load data from file."""
@@ -25,16 +34,21 @@ class Storage:
         return {"best_times": {"easy": None, "medium": None, "hard": None, "expert": None}}
 
     def _save(self) -> None:
-        """Save data to file."""
+        """Save data to file atomically."""
+        # Write a sibling tempfile and swap it in, so a crash mid-write
+        # can't leave a truncated scores file; compact separators keep
+        # the serialization pass small
+        tmp_path = self.path.with_suffix(".tmp")
         try:
-            with open(self.path, "w") as f:
-                json.dump(self._data, f, indent=2)
+            with open(tmp_path, "w") as f:
+                json.dump(self._data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
         except IOError:
             pass
 
     def get_best_time(self, difficulty: str) -> Optional[float]:
         """Get best time for a difficulty level."""
-        return self._data.get("best_times", {}).get(difficulty.lower())
+        return self._ensure_loaded().get("best_times", {}).get(difficulty.lower())
 
     def set_best_time(self, difficulty: str, time: float) -> bool:
         """
@@ -45,13 +59,14 @@ class Storage:
         current_best = self.get_best_time(difficulty)
 
         if current_best is None or time < current_best:
-            if "best_times" not in self._data:
-                self._data["best_times"] = {}
-            self._data["best_times"][difficulty] = time
+            data = self._ensure_loaded()
+            if "best_times" not in data:
+                data["best_times"] = {}
+            data["best_times"][difficulty] = time
             self._save()
             return True
         return False
 
     def get_all_best_times(self) -> dict:
         """Get all best times."""
-        return self._data.get("best_times", {})
+        return self._ensure_loaded().get("best_times", {})
@@ -6,6 +6,22 @@ from textual.message import Message
 from rich.text import Text
 
 
+def _build_note_strs() -> tuple[str, ...]:
+    """Precompute the display string for every 9-bit note mask."""
+    strs = []
+    for mask in range(512):
+        digits = [str(d) for d in range(1, 10) if mask >> (d - 1) & 1]
+        if len(digits) <= 5:
+            strs.append(" ".join(digits))
+        else:
+            strs.append(" ".join(digits[:4]) + "+")
+    return tuple(strs)
+
+
+# Rendered notes text indexed by note mask, so render is a table lookup
+_NOTE_STRS = _build_note_strs()
+
+
 class Cell(Widget):
     """A single cell in the Sudoku grid."""
 
@@ -55,7 +71,8 @@ class Cell(Widget):
     """
 
     value: reactive[int] = reactive(0)
-    notes: reactive[frozenset] = reactive(frozenset())
+    # Note bitmask matching Board.notes: bit d-1 set if digit d is noted
+    notes: reactive[int] = reactive(0)
     is_given: reactive[bool] = reactive(False)
     is_selected: reactive[bool] = reactive(False)
     is_highlighted: reactive[bool] = reactive(False)
@@ -73,6 +90,9 @@ class Cell(Widget):
         self.row = row
         self.col = col
         self.can_focus = False
+        # True while set_state is writing several reactives; watchers
+        # stand down so classes are recomputed once instead of per write
+        self._batch_update = False
 
     def on_mount(self) -> None:
         """Set up border classes based on position."""
@@ -87,30 +107,58 @@ class Cell(Widget):
         """Handle cell click."""
         self.post_message(self.Selected(self.row, self.col))
 
+    def set_state(self, value: int, notes: int, is_given: bool,
+                  is_selected: bool, is_highlighted: bool,
+                  is_conflict: bool) -> None:
+        """
+        Set all board-driven state in one call. The watchers are muted
+        while the reactives are written, then classes are recomputed and
+        the cell refreshed exactly once instead of once per attribute.
+        """
+        self._batch_update = True
+        try:
+            self.value = value
+            self.notes = notes
+            self.is_given = is_given
+            self.is_selected = is_selected
+            self.is_highlighted = is_highlighted
+            self.is_conflict = is_conflict
+        finally:
+            self._batch_update = False
+        self._update_classes()
+        self.refresh()
+
     def watch_value(self, value: int) -> None:
         """React to value changes."""
+        if self._batch_update:
+            return
         self._update_classes()
         self.refresh()
 
     def watch_is_given(self, is_given: bool) -> None:
         """React to is_given changes."""
-        self._update_classes()
+        if not self._batch_update:
+            self._update_classes()
 
     def watch_is_selected(self, is_selected: bool) -> None:
         """React to selection changes."""
-        self._update_classes()
+        if not self._batch_update:
+            self._update_classes()
 
     def watch_is_highlighted(self, is_highlighted: bool) -> None:
         """React to highlight changes."""
-        self._update_classes()
+        if not self._batch_update:
+            self._update_classes()
 
     def watch_is_conflict(self, is_conflict: bool) -> None:
         """React to conflict changes."""
-        self._update_classes()
+        if not self._batch_update:
+            self._update_classes()
 
-    def watch_notes(self, notes: frozenset) -> None:
+    def watch_notes(self, notes: int) -> None:
         """React to notes changes."""
-        self.refresh()
+        if not self._batch_update:
+            self.refresh()
 
     def _update_classes(self) -> None:
         """Update CSS classes based on state."""
@@ -133,16 +181,7 @@ class Cell(Widget):
         if self.value != 0:
             return Text(f" {self.value} ", justify="center")
         elif self.notes:
-            # Render notes in a compact format
-            notes_str = self._format_notes()
-            return Text(notes_str, style="dim", justify="center")
+            # Render notes in a compact format via the precomputed table
+            return Text(_NOTE_STRS[self.notes], style="dim", justify="center")
         else:
             return Text(" ", justify="center")
-
-    def _format_notes(self) -> str:
-        """Format notes as a compact string."""
-        sorted_notes = sorted(self.notes)
-        if len(sorted_notes) <= 5:
-            return " ".join(str(n) for n in sorted_notes)
-        else:
-            return " ".join(str(n) for n in sorted_notes[:4]) + "+"
@@ -5,7 +5,7 @@ from textual.widgets import Button
 from textual.containers import Horizontal
 from textual.message import Message
 
-from models.generator import Difficulty
+from models.difficulty import Difficulty
 
 
 class Controls(Widget):
@@ -5,7 +5,7 @@ from textual.containers import Container, Grid
 from textual.message import Message
 
 from widgets.cell import Cell
-from models.board import Board
+from models.board import ALL_PEERS, Board
 
 
 class SudokuGrid(Widget):
@@ -47,6 +47,14 @@ class SudokuGrid(Widget):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self.cells: list[list[Cell]] = []
+        self._last_highlight: int = 0
+        # Last (value, note mask, given, selected, highlighted, conflict)
+        # pushed to each cell, so unchanged cells skip reactive writes
+        self._last_state: list = [None] * 81
+        # Memoized conflict/highlight sets, keyed on the board version so
+        # pure selection repaints don't rescan the board
+        self._derived_key: tuple | None = None
+        self._derived: tuple[set, set] = (set(), set())
 
     def compose(self):
         """Create the grid of cells."""
@@ -66,31 +74,75 @@ class SudokuGrid(Widget):
     def update_from_board(self, board: Board, selected: tuple[int, int] | None,
                           highlight_digit: int = 0) -> None:
         """Update all cells from board state."""
-        # Get conflicts for the selected cell
-        conflicts = set()
-        if selected:
-            sel_row, sel_col = selected
-            sel_value = board.get_value(sel_row, sel_col)
-            if sel_value != 0:
-                conflicts = set(board.get_conflicts(sel_row, sel_col))
-                # Add the selected cell itself if it has conflicts
-                if conflicts:
-                    conflicts.add(selected)
-
-        # Get positions of highlighted digit
-        highlighted_positions = set()
-        if highlight_digit != 0:
-            highlighted_positions = set(board.get_same_digit_positions(highlight_digit))
-
-        for row in range(9):
-            for col in range(9):
-                cell = self.cells[row][col]
-                cell.value = board.get_value(row, col)
-                cell.notes = frozenset(board.get_notes(row, col))
-                cell.is_given = board.is_given(row, col)
-                cell.is_selected = selected == (row, col)
-                cell.is_highlighted = (row, col) in highlighted_positions and not cell.is_selected
-                cell.is_conflict = (row, col) in conflicts
+        self._refresh_cells(range(81), board, selected, highlight_digit)
+
+    def update_cells(self, board: Board, changed: set[tuple[int, int]],
+                     selected: tuple[int, int] | None,
+                     highlight_digit: int = 0) -> None:
+        """
+        Update only the cells affected by edits at the given positions:
+        the edited cells, their peers (conflict state), and any cells whose
+        same-digit highlight may have changed.
+        """
+        indices = set()
+        for row, col in changed:
+            index = row * 9 + col
+            indices.add(index)
+            indices.update(ALL_PEERS[index])
+        for digit in {self._last_highlight, highlight_digit}:
+            if digit != 0:
+                indices.update(r * 9 + c
+                               for r, c in board.get_same_digit_positions(digit))
+        self._refresh_cells(indices, board, selected, highlight_digit)
+
+    def _refresh_cells(self, indices, board: Board,
+                       selected: tuple[int, int] | None,
+                       highlight_digit: int) -> None:
+        """Push board state into the cell widgets at the given flat indices."""
+        derived_key = (id(board), board.version, selected, highlight_digit)
+        if derived_key == self._derived_key:
+            conflicts, highlighted_positions = self._derived
+        else:
+            # Get conflicts for the selected cell
+            conflicts = set()
+            if selected:
+                sel_row, sel_col = selected
+                sel_value = board.get_value(sel_row, sel_col)
+                if sel_value != 0:
+                    conflicts = set(board.get_conflicts(sel_row, sel_col))
+                    # Add the selected cell itself if it has conflicts
+                    if conflicts:
+                        conflicts.add(selected)
+
+            # Get positions of highlighted digit
+            highlighted_positions = set()
+            if highlight_digit != 0:
+                highlighted_positions = set(board.get_same_digit_positions(highlight_digit))
+
+            self._derived_key = derived_key
+            self._derived = (conflicts, highlighted_positions)
+
+        last_state = self._last_state
+        for index in indices:
+            row, col = divmod(index, 9)
+            pos = (row, col)
+            value = board.current_values[index]
+            note_mask = board.notes[index]
+            is_given = board.initial_values[index] != 0
+            is_selected = selected == pos
+            is_highlighted = pos in highlighted_positions and not is_selected
+            is_conflict = pos in conflicts
+            state = (value, note_mask, is_given,
+                     is_selected, is_highlighted, is_conflict)
+            if last_state[index] == state:
+                continue
+
+            # One coalesced write: a single class update and refresh per
+            # changed cell instead of one per attribute
+            self.cells[row][col].set_state(*state)
+            last_state[index] = state
+
+        self._last_highlight = highlight_digit
 
     def get_cell(self, row: int, col: int) -> Cell:
         """Get a cell by position."""
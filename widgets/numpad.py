@@ -80,7 +80,8 @@ class Numpad(Widget):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.digit_buttons: dict[int, Button] = {}
+        # Indexed by digit, slot 0 unused
+        self.digit_buttons: list[Button | None] = [None] * 10
 
     def compose(self):
         """Create the numpad layout."""
@@ -99,12 +100,13 @@ class Numpad(Widget):
         elif btn_id == "clear-btn":
             self.post_message(self.ClearPressed())
 
-    def update_digit_states(self, counts: dict[int, int], highlighted_digit: int = 0) -> None:
-        """Update button states based on digit counts."""
-        for digit, btn in self.digit_buttons.items():
+    def update_digit_states(self, counts: list[int], highlighted_digit: int = 0) -> None:
+        """Update button states from a digit-indexed count list."""
+        for digit in range(1, 10):
+            btn = self.digit_buttons[digit]
             btn.remove_class("complete", "highlighted")
 
-            if counts.get(digit, 0) >= 9:
+            if counts[digit] >= 9:
                 btn.add_class("complete")
             elif digit == highlighted_digit:
                 btn.add_class("highlighted")
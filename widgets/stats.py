@@ -1,5 +1,7 @@
 """Stats widget showing timer and digit counts."""
 
+from functools import lru_cache
+
 from textual.widget import Widget
 from textual.widgets import Static, Label
 from textual.containers import Vertical, Horizontal
@@ -15,61 +17,92 @@ CIRCLED_NUMBERS = {
 }
 
 
-class DigitCount(Widget):
-    """A single digit count display."""
+def _build_line_table() -> tuple[str, ...]:
+    """Materialize every digit-count line (9 digits x counts 0-9)."""
+    table = []
+    for digit in range(1, 10):
+        circled = CIRCLED_NUMBERS[digit]
+        for count in range(10):
+            check = "  \u2713" if count >= 9 else ""
+            table.append(f" {circled}  {count}/9{check}")
+    return tuple(table)
+
+
+# Shared line per digit count, indexed (digit - 1) * 10 + count
+_COUNT_LINES = _build_line_table()
+
+
+@lru_cache(maxsize=256)
+def _build_counts_text(counts: tuple[int, ...], highlighted: int) -> Text:
+    """
+    Build the nine-line counts display for a digit-indexed count tuple.
+    Cached: games revisit the same count vectors constantly (hovering
+    between cells of one digit, undo/redo), and the result is treated as
+    read-only by the compositor.
+    """
+    text = Text()
+    for digit in range(1, 10):
+        count = counts[digit]
+        # Counts above 9 (conflicting duplicates) clamp to the 9/9 line
+        line = _COUNT_LINES[(digit - 1) * 10 + min(count, 9)]
+        if count >= 9:
+            style = "#6bcb77"
+        elif digit == highlighted:
+            style = "on #1a3a3a"
+        else:
+            style = ""
+        text.append(line, style)
+        if digit < 9:
+            text.append("\n")
+    return text
+
+
+class DigitCounts(Widget):
+    """All nine digit-count rows, rendered as a single widget."""
 
     DEFAULT_CSS = """
-    DigitCount {
+    DigitCounts {
         width: 100%;
-        height: 1;
+        height: 9;
         padding: 0 1;
     }
 
-    DigitCount:hover {
+    DigitCounts:hover {
         background: #252545;
     }
-
-    DigitCount.complete {
-        color: #6bcb77;
-    }
-
-    DigitCount.highlighted {
-        background: #1a3a3a;
-    }
     """
 
     class Clicked(Message):
-        """Message when digit count is clicked."""
+        """Message when a digit-count row is clicked."""
+        __slots__ = ("digit",)
+
         def __init__(self, digit: int) -> None:
             self.digit = digit
             super().__init__()
 
-    def __init__(self, digit: int, **kwargs) -> None:
+    def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.digit = digit
-        self.count = 0
-
-    def on_click(self) -> None:
-        """Handle click."""
-        self.post_message(self.Clicked(self.digit))
-
-    def update_count(self, count: int, is_highlighted: bool = False) -> None:
-        """Update the count display."""
-        self.count = count
-        self.remove_class("complete", "highlighted")
-
-        if count >= 9:
-            self.add_class("complete")
-        elif is_highlighted:
-            self.add_class("highlighted")
-
+        # Digit-indexed counts (slot 0 unused) and the highlighted digit
+        self._counts: tuple[int, ...] = (0,) * 10
+        self._highlighted = 0
+
+    def on_click(self, event) -> None:
+        """Map the clicked row back to its digit."""
+        digit = event.y + 1
+        if 1 <= digit <= 9:
+            self.post_message(self.Clicked(digit))
+
+    def update_counts(self, counts: tuple[int, ...], highlighted: int) -> None:
+        """Update the counts display, skipping no-op updates."""
+        if counts == self._counts and highlighted == self._highlighted:
+            return
+        self._counts = counts
+        self._highlighted = highlighted
         self.refresh()
 
     def render(self) -> Text:
-        """Render the digit count."""
-        circled = CIRCLED_NUMBERS[self.digit]
-        check = "  \u2713" if self.count >= 9 else ""
-        return Text(f" {circled}  {self.count}/9{check}")
+        """Render all nine count rows."""
+        return _build_counts_text(self._counts, self._highlighted)
 
 
 class Stats(Widget):
@@ -128,24 +161,20 @@ class Stats(Widget):
         width: 100%;
         padding-bottom: 1;
     }
-
-    Stats .counts-grid {
-        width: 100%;
-        height: auto;
-    }
     """
 
-    class DigitClicked(Message):
-        """Message when a digit count is clicked."""
-        def __init__(self, digit: int) -> None:
-            self.digit = digit
-            super().__init__()
+    # Consumers handle the bubbling DigitCounts.Clicked directly; the old
+    # name is kept as an alias so annotations still read naturally
+    DigitClicked = DigitCounts.Clicked
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.digit_counts: dict[int, DigitCount] = {}
+        self.counts_display: DigitCounts | None = None
         self.timer_label: Static | None = None
         self.best_label: Static | None = None
+        # Last strings pushed to the Statics, so repeat updates no-op
+        self._last_timer: str | None = None
+        self._last_best: str | None = None
 
     def compose(self):
         """Create the stats display."""
@@ -159,27 +188,23 @@ class Stats(Widget):
                 yield self.best_label
 
             yield Static("Counts", classes="counts-label")
-            with Vertical(classes="counts-grid"):
-                for digit in range(1, 10):
-                    dc = DigitCount(digit, id=f"count-{digit}")
-                    self.digit_counts[digit] = dc
-                    yield dc
-
-    def on_digit_count_clicked(self, event: DigitCount.Clicked) -> None:
-        """Handle digit count click."""
-        self.post_message(self.DigitClicked(event.digit))
+            self.counts_display = DigitCounts(id="counts")
+            yield self.counts_display
 
     def update_timer(self, time_str: str) -> None:
         """Update the timer display."""
-        if self.timer_label:
+        if self.timer_label and time_str != self._last_timer:
+            self._last_timer = time_str
             self.timer_label.update(time_str)
 
     def update_best_time(self, time_str: str | None) -> None:
         """Update the best time display."""
-        if self.best_label:
-            self.best_label.update(time_str or "--:--")
-
-    def update_counts(self, counts: dict[int, int], highlighted_digit: int = 0) -> None:
-        """Update all digit counts."""
-        for digit, dc in self.digit_counts.items():
-            dc.update_count(counts.get(digit, 0), digit == highlighted_digit)
+        time_str = time_str or "--:--"
+        if self.best_label and time_str != self._last_best:
+            self._last_best = time_str
+            self.best_label.update(time_str)
+
+    def update_counts(self, counts: list[int], highlighted_digit: int = 0) -> None:
+        """Update all digit counts from a digit-indexed count list."""
+        if self.counts_display:
+            self.counts_display.update_counts(tuple(counts), highlighted_digit)